@@ -1,13 +1,49 @@
 from abc import ABC
-from dataclasses import dataclass
-from typing import Callable
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Callable
 
-from .ctx import Ctx
+from .ctx import MISSING, Ctx
 from .errors import SemanticError
-from .node import Node, Cursor
+from .node import Node
+
+if TYPE_CHECKING:
+    from .validator import AstValidator
 
 Value = bool | str | float | None
 
+def node_dataclass(cls):
+    """
+    Decorador dos nós da árvore sintática: cria um dataclass com slots.
+
+    Atributos declarados com runtime_attr() não são removidos do dataclass, mas
+    são removidos de __annotations__, que o módulo node usa para encontrar os
+    filhos de cada nó. Deste modo, não aparecem em pretty(), children(), etc.
+
+    As anotações são montadas a partir de todos os campos do dataclass, inclusive
+    os herdados, para que subclasses de nós sem campos próprios (ex.: BinOpNum)
+    continuem expondo os filhos da classe base.
+    """
+    cls = dataclass(slots=True)(cls)
+    cls.__annotations__ = {
+        f.name: f.type for f in fields(cls) if not f.metadata.get("runtime")
+    }
+    return cls
+
+
+def runtime_attr(default=None):
+    """
+    Atributo de um nó preenchido depois da construção da árvore sintática,
+    como as posições calculadas pelo resolvedor ou caches usados na execução.
+
+    Não faz parte do construtor, da comparação ou da representação do nó.
+    """
+    return field(default=default, init=False, repr=False, compare=False, metadata={"runtime": True})
+
+
+# Palavras reservadas que não podem ser usadas como nomes de variáveis
+_RESERVED = frozenset({"true", "false", "nil", "return", "var", "fun", "class", "if", "else", "while", "for", "print", "and", "or", "this", "super"})
+
+
 class Expr(Node, ABC):
     """
     Classe base para expressões.
@@ -17,6 +53,8 @@ class Expr(Node, ABC):
     funções, etc.
     """
 
+    __slots__ = ()
+
 
 class Stmt(Node, ABC):
     """
@@ -26,8 +64,10 @@ class Stmt(Node, ABC):
     execução do código ou declaram elementos como classes, funções, etc.
     """
 
+    __slots__ = ()
 
-@dataclass
+
+@node_dataclass
 class Program(Node):
     """
     Representa um programa.
@@ -37,11 +77,32 @@ class Program(Node):
 
     stmts: list[Stmt]
 
-    def eval(self, ctx: Ctx):
-        for stmt in self.stmts:
-            stmt.eval(ctx)
+    # Métodos eval dos comandos, associados na primeira execução (veja Block).
+    _evals: tuple | None = runtime_attr()
 
-@dataclass
+    def eval(self, ctx: Ctx):
+        evals = self._evals
+        if evals is None:
+            evals = self._evals = tuple(stmt.eval for stmt in self.stmts)
+        for stmt_eval in evals:
+            stmt_eval(ctx)
+
+
+# Códigos das operações binárias que possuem um caminho rápido entre números em
+# BinOp.eval. As demais operações usam OP_GENERIC.
+OP_GENERIC = 0
+OP_ADD = 1
+OP_SUB = 2
+OP_MUL = 3
+OP_LT = 4
+OP_GT = 5
+OP_LE = 6
+OP_GE = 7
+OP_EQ = 8
+OP_NE = 9
+
+
+@node_dataclass
 class BinOp(Expr):
     """
     Uma operação infixa com dois operandos.
@@ -53,13 +114,56 @@ class BinOp(Expr):
     right: Expr
     op: Callable[[Value, Value], Value]
 
+    # Código da operação (OP_ADD, OP_SUB, ...), atribuído pelo transformer.
+    # Operações sem código usam OP_GENERIC e sempre chamam self.op.
+    op_tag: int = runtime_attr(OP_GENERIC)
+
     def eval(self, ctx: Ctx):
         left_value = self.left.eval(ctx)
         right_value = self.right.eval(ctx)
+
+        # Caminho rápido para operações entre números, que evita as
+        # verificações de tipo das funções do runtime.
+        if type(left_value) is float and type(right_value) is float:
+            tag = self.op_tag
+            if tag == OP_ADD:
+                return left_value + right_value
+            elif tag == OP_SUB:
+                return left_value - right_value
+            elif tag == OP_MUL:
+                return left_value * right_value
+            elif tag == OP_LT:
+                return left_value < right_value
+            elif tag == OP_GT:
+                return left_value > right_value
+            elif tag == OP_LE:
+                return left_value <= right_value
+            elif tag == OP_GE:
+                return left_value >= right_value
+            elif tag == OP_EQ:
+                return left_value == right_value
+            elif tag == OP_NE:
+                return left_value != right_value
         return self.op(left_value, right_value)
 
 
-@dataclass
+@node_dataclass
+class BinOpNum(BinOp):
+    """
+    Uma operação infixa cujos operandos certamente são números.
+
+    Criada pelo transformer a partir de uma inferência de tipos simples. Neste
+    caso, op é a função correspondente do módulo operator e a operação é
+    executada sem verificações de tipo.
+
+    Ex.: (x - 1) * (y - 1)
+    """
+
+    def eval(self, ctx: Ctx):
+        return self.op(self.left.eval(ctx), self.right.eval(ctx))
+
+
+@node_dataclass
 class Var(Expr):
     """
     Uma variável no código
@@ -69,33 +173,35 @@ class Var(Expr):
 
     name: str
 
+    # Posição da variável local, preenchida pelo resolvedor. Variáveis globais
+    # mantêm env_depth = None e são buscadas pelo nome.
+    env_depth: int | None = runtime_attr()
+    slot: int | None = runtime_attr()
+
     def eval(self, ctx: Ctx):
-        try:
-            return ctx[self.name]
-        except KeyError:
-            raise NameError(f"variável {self.name} não existe!")
+        depth = self.env_depth
+        if depth is None:
+            value = ctx.lookup(self.name)
+            if value is MISSING:
+                raise NameError(f"variável {self.name} não existe!")
+            return value
+
+        while depth:
+            ctx = ctx.parent
+            depth -= 1
+        return ctx.slots[self.slot]
     
-    def validate_self(self, cursor: Cursor):
-        reserved_words = {"true", "false", "nil", "return", "var", "fun", "class", "if", "else", "while", "for", "print", "and", "or", "this", "super"}
-        
-        if self.name in reserved_words:
+    def validate_self(self, state: "AstValidator"):
+        if self.name in _RESERVED:
             raise SemanticError("Expect variable name.", token=self.name)
         
-        for parent_cursor in cursor.parents():
-            if isinstance(parent_cursor.node, VarDef):
-                if parent_cursor.node.name == self.name:
-                    is_local = False
-                    for ancestor in parent_cursor.parents():
-                        if isinstance(ancestor.node, Block):
-                            is_local = True
-                            break
-                    
-                    if is_local:
-                        raise SemanticError("Can't read local variable in its own initializer.", token=self.name)
-                break
+        if state.initializer_stack:
+            initializer = state.initializer_stack[-1]
+            if initializer.is_local and initializer.vardef.name == self.name:
+                raise SemanticError("Can't read local variable in its own initializer.", token=self.name)
 
 
-@dataclass
+@node_dataclass
 class Literal(Expr):
     """
     Representa valores literais no código, ex.: strings, booleanos,
@@ -110,7 +216,7 @@ class Literal(Expr):
         return self.value
 
 
-@dataclass
+@node_dataclass
 class And(Expr):
     """
     Uma operação infixa com dois operandos.
@@ -127,7 +233,7 @@ class And(Expr):
         return self.right.eval(ctx)
 
 
-@dataclass
+@node_dataclass
 class Or(Expr):
     """
     Uma operação infixa com dois operandos.
@@ -143,7 +249,7 @@ class Or(Expr):
         return self.right.eval(ctx)
 
 
-@dataclass
+@node_dataclass
 class UnaryOp(Expr):
     """
     Uma operação prefixa com um operando.
@@ -158,7 +264,7 @@ class UnaryOp(Expr):
         return self.op(value)
 
 
-@dataclass
+@node_dataclass
 class Call(Expr):
     """
     Uma chamada de função.
@@ -167,19 +273,56 @@ class Call(Expr):
     """
     func: Expr
     params: list[Expr]
+
+    # Métodos eval dos argumentos, associados na primeira execução.
+    _param_evals: tuple | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
         func_obj = self.func.eval(ctx)
-        params = []
-        for param in self.params:
-            params.append(param.eval(ctx))
-        
-        if callable(func_obj):
-            return func_obj(*params)
+        params = self._param_evals
+        if params is None:
+            params = self._param_evals = tuple(param.eval for param in self.params)
+        n = len(params)
+
+        # Chamadas com poucos argumentos são especializadas para evitar a
+        # criação de uma lista de argumentos a cada chamada. Funções e métodos
+        # Lox com a aridade correta são executados diretamente pela função de
+        # chamada, sem passar por __call__. Nos demais casos, __call__ verifica
+        # a aridade e emite o erro apropriado.
+        if n == 0:
+            if type(func_obj) in LOX_CALLABLES and not func_obj.params:
+                return func_obj._call(func_obj.ctx)
+            if callable(func_obj):
+                return func_obj()
+        elif n == 1:
+            a = params[0](ctx)
+            if type(func_obj) in LOX_CALLABLES and len(func_obj.params) == 1:
+                return func_obj._call(func_obj.ctx, a)
+            if callable(func_obj):
+                return func_obj(a)
+        elif n == 2:
+            a = params[0](ctx)
+            b = params[1](ctx)
+            if type(func_obj) in LOX_CALLABLES and len(func_obj.params) == 2:
+                return func_obj._call(func_obj.ctx, a, b)
+            if callable(func_obj):
+                return func_obj(a, b)
+        elif n == 3:
+            a = params[0](ctx)
+            b = params[1](ctx)
+            c = params[2](ctx)
+            if type(func_obj) in LOX_CALLABLES and len(func_obj.params) == 3:
+                return func_obj._call(func_obj.ctx, a, b, c)
+            if callable(func_obj):
+                return func_obj(a, b, c)
+        else:
+            args = tuple(param_eval(ctx) for param_eval in params)
+            if callable(func_obj):
+                return func_obj(*args)
         raise TypeError(f"Objeto não é uma função!")
 
 
-@dataclass
+@node_dataclass
 class This(Expr):
     """
     Acesso ao `this`.
@@ -188,27 +331,32 @@ class This(Expr):
     """
     
     _placeholder: str = "this"
+
+    env_depth: int | None = runtime_attr()
+    slot: int | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
-        try:
-            return ctx["this"]
-        except KeyError:
-            raise NameError("variável this não existe!")
+        depth = self.env_depth
+        if depth is None:
+            value = ctx.lookup("this")
+            if value is MISSING:
+                raise NameError("variável this não existe!")
+            return value
+
+        while depth:
+            ctx = ctx.parent
+            depth -= 1
+        return ctx.slots[self.slot]
     
-    def validate_self(self, cursor):
+    def validate_self(self, state: "AstValidator"):
         """
         Valida que this só pode aparecer dentro de uma classe.
         """
-        from .node import Cursor
-        from .errors import SemanticError
-        
-        for parent_cursor in cursor.parents():
-            if isinstance(parent_cursor.node, Class):
-                return  
-        raise SemanticError("Can't use 'this' outside of a class.", token="this")
+        if not state.class_stack:
+            raise SemanticError("Can't use 'this' outside of a class.", token="this")
 
 
-@dataclass
+@node_dataclass
 class Super(Expr):
     """
     Acesso a method ou atributo da superclasse.
@@ -217,8 +365,19 @@ class Super(Expr):
     """
     
     method_name: str = ""
+
+    env_depth: int | None = runtime_attr()
+    slot: int | None = runtime_attr()
+    this_depth: int | None = runtime_attr()
+    this_slot: int | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
+        if self.env_depth is not None:
+            superclass = ctx.get_slot(self.env_depth, self.slot)
+            this = ctx.get_slot(self.this_depth, self.this_slot)
+            method = superclass.get_method(self.method_name)
+            return method.bind(this)
+
         try:
             superclass = ctx["super"]
             this = ctx["this"]
@@ -232,27 +391,18 @@ class Super(Expr):
             else:
                 raise
     
-    def validate_self(self, cursor):
+    def validate_self(self, state: "AstValidator"):
         """
         Valida que super só pode aparecer dentro de uma classe que herda de outra.
         """
-        from .node import Cursor
-        from .errors import SemanticError
-        
-        enclosing_class = None
-        for parent_cursor in cursor.parents():
-            if isinstance(parent_cursor.node, Class):
-                enclosing_class = parent_cursor.node
-                break
-        
-        if enclosing_class is None:
+        if not state.class_stack:
             raise SemanticError("Can't use 'super' outside of a class.", token="super")
         
-        if enclosing_class.superclass is None:
+        if state.class_stack[-1].superclass is None:
             raise SemanticError("Can't use 'super' in a class with no superclass.", token="super")
 
 
-@dataclass
+@node_dataclass
 class Assign(Expr):
     """
     Atribuição de variável.
@@ -261,10 +411,21 @@ class Assign(Expr):
     """
     name: str
     value: Expr
+
+    env_depth: int | None = runtime_attr()
+    slot: int | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
         result = self.value.eval(ctx)
-        ctx.assign(self.name, result)
+        depth = self.env_depth
+        if depth is None:
+            ctx.assign(self.name, result)
+            return result
+
+        while depth:
+            ctx = ctx.parent
+            depth -= 1
+        ctx.slots[self.slot] = result
         return result
 
 
@@ -278,17 +439,26 @@ class Getattr(Expr):
     value: Expr
     attr: str
 
+    def __post_init__(self):
+        # Cache do último método encontrado neste ponto do código. Não é um
+        # campo do dataclass para não aparecer entre os filhos do nó. Getattr
+        # não usa slots: os exercícios inspecionam seus atributos por meio de
+        # __dict__.
+        self._method_cache = MethodCache()
+
     def eval(self, ctx):
-        from .runtime import LoxInstance, LoxClass
-        obj = self.value.eval(ctx)
-        
+        return self.get(self.value.eval(ctx))
+
+    def get(self, obj: Value) -> Value:
+        """
+        Obtém o atributo de obj, usando o cache de métodos para instâncias.
+        """
         if isinstance(obj, LoxInstance):
-            return getattr(obj, self.attr)
-        
+            return obj.get_attr(self.attr, self._method_cache)
         return getattr(obj, self.attr)
 
 
-@dataclass
+@node_dataclass
 class Setattr(Expr):
     """
     Atribuição de atributo de um objeto.
@@ -300,7 +470,6 @@ class Setattr(Expr):
     expr: Expr
 
     def eval(self, ctx):
-        from .runtime import LoxInstance, LoxClass, LoxFunction
         obj = self.value.eval(ctx)
         val = self.expr.eval(ctx)
         
@@ -310,7 +479,7 @@ class Setattr(Expr):
         setattr(obj, self.attr, val)
         return val
 
-@dataclass
+@node_dataclass
 class Print(Stmt):
     """
     Representa uma instrução de impressão.
@@ -320,12 +489,11 @@ class Print(Stmt):
     expr: Expr
     
     def eval(self, ctx: Ctx):
-        from .runtime import print
         value = self.expr.eval(ctx)
-        print(value)
+        lox_print(value)
 
 
-@dataclass
+@node_dataclass
 class Return(Stmt):
     """
     Representa um comando return.
@@ -339,37 +507,22 @@ class Return(Stmt):
             result = self.value.eval(ctx)
         else:
             result = None
-        from .runtime import LoxReturn
-        raise LoxReturn(result)
+        RETURN_SIGNAL.value = result
+        return RETURN_SIGNAL
     
-    def validate_self(self, cursor):
+    def validate_self(self, state: "AstValidator"):
         """
         Valida que return só pode aparecer dentro de uma função.
         Também valida que return com valor não pode aparecer em init.
         """
-        from .node import Cursor
-        from .errors import SemanticError
-        
-        enclosing_function = None
-        for parent_cursor in cursor.parents():
-            if isinstance(parent_cursor.node, Function):
-                enclosing_function = parent_cursor.node
-                break
-        
-        if enclosing_function is None:
+        if not state.function_stack:
             raise SemanticError("Can't return from top-level code.", token="return")
             
-        if enclosing_function.name == "init" and self.value is not None:
-            function_parent = None
-            for parent_cursor in cursor.parents():
-                if isinstance(parent_cursor.node, Function) and parent_cursor.node == enclosing_function:
-                    function_parent = parent_cursor.parent()
-                    break
-            if function_parent and isinstance(function_parent.node, Class):
-                raise SemanticError("Can't return a value from an initializer.", token="return")
+        if state.function_stack[-1].is_initializer and self.value is not None:
+            raise SemanticError("Can't return a value from an initializer.", token="return")
 
 
-@dataclass
+@node_dataclass
 class VarDef(Stmt):
     """
     Representa uma declaração de variável.
@@ -378,20 +531,24 @@ class VarDef(Stmt):
     """
     name: str
     value: Expr
+
+    # Posição da variável no escopo local. Variáveis globais mantêm slot = None.
+    slot: int | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
         result = self.value.eval(ctx)
-        ctx.var_def(self.name, result)
+        if self.slot is None:
+            ctx.var_def(self.name, result)
+        else:
+            ctx.slots[self.slot] = result
         return ctx
     
-    def validate_self(self, cursor: Cursor):
-        reserved_words = {"true", "false", "nil", "return", "var", "fun", "class", "if", "else", "while", "for", "print", "and", "or", "this", "super"}
-        
-        if self.name in reserved_words:
+    def validate_self(self, state: "AstValidator"):
+        if self.name in _RESERVED:
             raise SemanticError("Expect variable name.", token=self.name)
 
 
-@dataclass
+@node_dataclass
 class If(Stmt):
     """
     Representa uma instrução condicional.
@@ -403,16 +560,17 @@ class If(Stmt):
     else_stmt: Stmt | None = None
     
     def eval(self, ctx: Ctx):
-        from .runtime import truthy
         condition_val = self.condition.eval(ctx)
         
-        if truthy(condition_val):
-            self.then_stmt.eval(ctx)
+        # O resultado é repassado para propagar o sinal de return. A condição
+        # usa a mesma regra de runtime.truthy, escrita diretamente.
+        if condition_val is not None and condition_val is not False:
+            return self.then_stmt.eval(ctx)
         elif self.else_stmt is not None:
-            self.else_stmt.eval(ctx)
+            return self.else_stmt.eval(ctx)
 
 
-@dataclass
+@node_dataclass
 class While(Stmt):
     """
     Representa um laço de repetição.
@@ -423,15 +581,19 @@ class While(Stmt):
     body: Stmt
     
     def eval(self, ctx: Ctx):
-        from .runtime import truthy
+        # Métodos associados a variáveis locais evitam buscas de atributos a
+        # cada iteração. A condição usa a mesma regra de runtime.truthy.
+        condition_eval = self.condition.eval
+        body_eval = self.body.eval
         while True:
-            condition_val = self.condition.eval(ctx)
-            if not truthy(condition_val):
-                break
-            self.body.eval(ctx)
+            condition_val = condition_eval(ctx)
+            if condition_val is None or condition_val is False:
+                return None
+            if body_eval(ctx) is RETURN_SIGNAL:
+                return RETURN_SIGNAL
 
 
-@dataclass
+@node_dataclass
 class Block(Stmt):
     """
     Representa bloco de comandos.
@@ -439,13 +601,33 @@ class Block(Stmt):
     Ex.: { var x = 42; print x;  }
     """
     stmts: list[Stmt]
+
+    # Número de variáveis locais declaradas no bloco, preenchido pelo
+    # resolvedor. Blocos sem declarações não criam um novo escopo. Blocos não
+    # resolvidos (None) usam um escopo baseado em dicionário.
+    n_locals: int | None = runtime_attr()
+
+    # Métodos eval dos comandos, associados na primeira execução, depois que a
+    # árvore já passou pelas transformações da análise sintática. Evita buscar
+    # o atributo eval de cada comando a cada execução do bloco.
+    _evals: tuple | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
-        new_ctx = ctx.push({})
-        for stmt in self.stmts:
-            stmt.eval(new_ctx)
+        evals = self._evals
+        if evals is None:
+            evals = self._evals = tuple(stmt.eval for stmt in self.stmts)
+        n_locals = self.n_locals
+        if n_locals is None:
+            new_ctx = ctx.push({})
+        elif n_locals:
+            new_ctx = ctx.push_frame([None] * n_locals)
+        else:
+            new_ctx = ctx
+        for stmt_eval in evals:
+            if stmt_eval(new_ctx) is RETURN_SIGNAL:
+                return RETURN_SIGNAL
     
-    def validate_self(self, cursor: Cursor):
+    def validate_self(self, state: "AstValidator"):
         declared_vars = set()
         
         for stmt in self.stmts:
@@ -453,18 +635,16 @@ class Block(Stmt):
                 if stmt.name in declared_vars:
                     raise SemanticError("Already a variable with this name in this scope.", token=stmt.name)
                 declared_vars.add(stmt.name)
-        parent = cursor.parent_cursor
-        while parent:
-            if isinstance(parent.node, Function):
-                for stmt in self.stmts:
-                    if isinstance(stmt, VarDef):
-                        if stmt.name in parent.node.params:
-                            raise SemanticError("Already a variable with this name in this scope.", token=stmt.name)
-                break
-            parent = parent.parent_cursor
 
+        if state.function_stack:
+            params = state.function_stack[-1].function.params
+            for stmt in self.stmts:
+                if isinstance(stmt, VarDef):
+                    if stmt.name in params:
+                        raise SemanticError("Already a variable with this name in this scope.", token=stmt.name)
 
-@dataclass
+
+@node_dataclass
 class Function(Stmt):
     """
     Representa uma função.
@@ -474,19 +654,29 @@ class Function(Stmt):
     name: str
     params: list[str]
     body: Block
+
+    slot: int | None = runtime_attr()
+    # Tamanho do escopo local de cada chamada, preenchido pelo resolvedor.
+    frame_size: int | None = runtime_attr()
+    # Função que executa o corpo, criada na primeira execução e compartilhada
+    # por todas as closures criadas a partir desta declaração.
+    _call: Callable | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
-        from .runtime import LoxFunction
-        function = LoxFunction(self.name, self.params, self.body, ctx)
-        ctx.var_def(self.name, function)
+        call = self._call
+        if call is None:
+            call = self._call = specialize_call(self.body, self.params, self.frame_size)
+        function = LoxFunction(self.name, self.params, self.body, ctx, self.frame_size, call)
+        if self.slot is None:
+            ctx.var_def(self.name, function)
+        else:
+            ctx.slots[self.slot] = function
         return function
     
-    def validate_self(self, cursor: Cursor):
-        reserved_words = {"true", "false", "nil", "return", "var", "fun", "class", "if", "else", "while", "for", "print", "and", "or", "this", "super"}
-        
+    def validate_self(self, state: "AstValidator"):
         for param in self.params:
             param_name = param.name if hasattr(param, 'name') else param
-            if param_name in reserved_words:
+            if param_name in _RESERVED:
                 raise SemanticError("Expect variable name.", token=param_name)
         
         param_names = [param.name if hasattr(param, 'name') else param for param in self.params]
@@ -501,7 +691,7 @@ class Function(Stmt):
                 seen.add(param_name)
 
 
-@dataclass
+@node_dataclass
 class Class(Stmt):
     """
     Representa uma classe.
@@ -511,43 +701,75 @@ class Class(Stmt):
     name: str
     methods: list["Function"]
     superclass: str = None
+
+    slot: int | None = runtime_attr()
+    super_depth: int | None = runtime_attr()
+    super_slot: int | None = runtime_attr()
+
+    # Tuplas (nome, parâmetros, corpo, tamanho do frame, função de chamada) de
+    # cada método, montadas na primeira execução, depois da resolução de
+    # variáveis.
+    _method_specs: tuple | None = runtime_attr()
     
     def eval(self, ctx: Ctx):
-        from .runtime import LoxClass, LoxFunction
 
         superclass = None
         if self.superclass is not None:
-            superclass = ctx[self.superclass]
+            if self.super_depth is None:
+                superclass = ctx[self.superclass]
+            else:
+                superclass = ctx.get_slot(self.super_depth, self.super_slot)
             if not isinstance(superclass, LoxClass):
                 raise SemanticError(f"Superclass must be a class.")
                 
-        class_name = self.name
-        method_defs = self.methods
+        method_specs = self._method_specs
+        if method_specs is None:
+            method_specs = self._method_specs = tuple(
+                (
+                    method.name,
+                    method.params,
+                    method.body,
+                    method.frame_size,
+                    specialize_call(method.body, method.params, method.frame_size),
+                )
+                for method in self.methods
+            )
     
         if superclass is None:
             method_ctx = ctx
         else:
-            method_ctx = ctx.push({"super": superclass})
+            # O super é acessível tanto pelo nome quanto pelo slot 0, para
+            # métodos resolvidos ou não.
+            method_ctx = Ctx({"super": superclass}, ctx, [superclass])
             
         methods = {}
-        for method in method_defs:
-            method_name = method.name
-            method_body = method.body
-            method_args = method.params
-            method_impl = LoxFunction(method_name, method_args, method_body, method_ctx)
-            methods[method_name] = method_impl
-
-        lox_class = LoxClass(class_name, methods, superclass)
-        ctx.var_def(self.name, lox_class)
+        for name, params, body, frame_size, call in method_specs:
+            methods[name] = LoxFunction(name, params, body, method_ctx, frame_size, call)
+
+        lox_class = LoxClass(self.name, methods, superclass)
+        if self.slot is None:
+            ctx.var_def(self.name, lox_class)
+        else:
+            ctx.slots[self.slot] = lox_class
         return lox_class
     
-    def validate_self(self, cursor):
+    def validate_self(self, state: "AstValidator"):
         """
         Valida que uma classe não pode herdar de si mesma.
         """
-        from .errors import SemanticError
-        
         if self.superclass is not None and self.superclass == self.name:
             raise SemanticError("A class can't inherit from itself.", token=self.superclass)
 
-from .runtime import LoxClass, LoxError, LoxInstance
\ No newline at end of file
+# Importado ao final para evitar a importação circular com lox.runtime. Os nomes
+# ficam disponíveis como globais do módulo, sem importações dentro dos métodos
+# eval.
+from .runtime import (
+    RETURN_SIGNAL,
+    LOX_CALLABLES,
+    LoxClass,
+    LoxFunction,
+    LoxInstance,
+    MethodCache,
+    print as lox_print,
+    specialize_call,
+)
@@ -1,7 +1,8 @@
 import math
 import time
 from dataclasses import field
-from typing import TYPE_CHECKING, Iterator, Optional, TypeVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TypeVar
 
 from lox.ast import dataclass
 
@@ -31,16 +32,30 @@ class _Builtins(dict):
 
 BUILTINS = _Builtins()
 
+# Valor retornado por Ctx.lookup quando a variável não existe.
+MISSING: Any = object()
 
-@dataclass
+# Escopo por nome dos frames baseados em slots. Como as variáveis desses
+# frames nunca são buscadas pelo nome, todos compartilham o mesmo dicionário
+# vazio, somente leitura, e empilhar um frame não aloca um dicionário novo.
+_FRAME_SCOPE: Any = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class Ctx:
     """
     Contexto de execução. Por enquanto é só um dicionário que armazena nomes
     das variáveis e seus respectivos valores.
+
+    Escopos locais resolvidos estaticamente (veja `lox.resolver`) guardam seus
+    valores na lista `slots`, indexada pela posição de cada variável. Os
+    contextos formam uma lista encadeada pelo atributo `parent`, cuja raiz
+    contém os builtins.
     """
 
     scope: ScopeDict = field(default_factory=dict)
     parent: Optional["Ctx"] = field(default_factory=lambda: Ctx(BUILTINS, None))
+    slots: list["Value"] | None = None
 
     @classmethod
     def from_dict(cls, env: ScopeDict) -> "Ctx":
@@ -53,11 +68,25 @@ class Ctx:
         """
         Obtém o valor de uma variável pelo nome.
         """
-        if name in self.scope:
-            return self.scope[name]
-        elif self.parent is not None:
-            return self.parent[name]
-        raise KeyError(f"Variable '{name}' not found in context.")
+        value = self.lookup(name)
+        if value is MISSING:
+            raise KeyError(f"Variable '{name}' not found in context.")
+        return value
+
+    def lookup(self, name: str) -> "Value":
+        """
+        Obtém o valor de uma variável pelo nome ou MISSING, caso ela não
+        exista.
+
+        Percorre os escopos com um laço, sem recursão e sem lançar exceções.
+        """
+        ctx: Ctx | None = self
+        while ctx is not None:
+            value = ctx.scope.get(name, MISSING)
+            if value is not MISSING:
+                return value
+            ctx = ctx.parent
+        return MISSING
 
     def __setitem__(self, name: str, value: "Value") -> None:
         """
@@ -129,6 +158,23 @@ class Ctx:
         """
         return Ctx(env, self)
 
+    def push_frame(self, slots: list["Value"]) -> "Ctx":
+        """
+        Empilha um novo escopo local cujas variáveis são acessadas pela posição
+        na lista slots.
+        """
+        return Ctx(_FRAME_SCOPE, self, slots)
+
+    def get_slot(self, depth: int, slot: int) -> "Value":
+        """
+        Obtém o valor na posição slot do escopo local depth níveis acima.
+        """
+        ctx = self
+        while depth:
+            ctx = ctx.parent  # type: ignore[assignment]
+            depth -= 1
+        return ctx.slots[slot]  # type: ignore[index]
+
     def is_global(self) -> bool:
         """
         Verifica se o contexto atual é o escopo global.
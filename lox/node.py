@@ -24,6 +24,7 @@ from lark import Token, Tree
 
 if TYPE_CHECKING:
     from .ast import Class, Function
+    from .validator import AstValidator
 
 
 N = TypeVar("N", bound="Node", contravariant=True)
@@ -38,6 +39,9 @@ class Node(ABC):
     criar subclasses que implementem os métodos abstratos definidos aqui.
     """
 
+    # Permite que as subclasses usem __slots__ para armazenar seus atributos.
+    __slots__ = ()
+
     def eval(self, ctx):
         name = type(self).__name__
         raise NotImplementedError(f"Método eval não implementado para {name}!")
@@ -292,12 +296,13 @@ class Node(ABC):
             cursor.node.desugar_self()
             pending.extend(cursor.children())
 
-    def validate_self(self, cursor: "Cursor[Node]"):
+    def validate_self(self, state: "AstValidator"):
         """
         Realiza a análise semântica do nó atual.
 
-        Recebe um cursor focado no objecto com relação à raiz do módulo. Isso
-        pode util para fazer consultas sobre os nós pais, irmãos, etc.
+        Recebe o estado do validador, com as pilhas de classes, funções e
+        declarações de variáveis que envolvem o nó. Isso permite consultar o
+        contexto do nó sem percorrer todos os seus pais.
 
         Caso o nó não seja válido, deve lançar uma exceção do tipo SemanticError.
         """
@@ -306,8 +311,9 @@ class Node(ABC):
         """
         Valida o nó atual e todos os filhos.
         """
-        for cursor in self.cursor().descendants():
-            cursor.node.validate_self(cursor)
+        from .validator import validate
+
+        validate(self)
 
 
 @dataclass
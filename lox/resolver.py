@@ -0,0 +1,156 @@
+"""
+Resolução estática de nomes.
+
+O resolvedor percorre a árvore sintática uma única vez, antes da execução,
+e associa cada variável local a uma posição fixa (slot) em uma lista, além da
+distância (env_depth) entre o escopo onde a variável é usada e o escopo onde
+ela foi declarada. Em tempo de execução, cada escopo local é uma lista de
+tamanho fixo e o acesso a uma variável local se resume a indexar esta lista,
+sem buscas em dicionários.
+
+Nomes que não são encontrados em nenhum escopo local são globais e continuam
+sendo buscados pelo nome no contexto.
+
+Os escopos criados pelo resolvedor devem corresponder exatamente aos escopos
+criados em tempo de execução:
+
+* Blocos que declaram ao menos um nome.
+* Os parâmetros de cada função, junto com as variáveis declaradas diretamente
+  no corpo da função.
+* O `this` de cada método.
+* O `super` dos métodos de classes que herdam de outras.
+"""
+
+from functools import singledispatchmethod
+from typing import Iterable
+
+from .ast import Assign, Block, Class, Function, Node, Super, This, Var, VarDef
+
+DECLARATIONS = (VarDef, Function, Class)
+
+
+def resolve(node: Node) -> Node:
+    """
+    Resolve todas as variáveis locais do nó e de seus descendentes.
+    """
+    Resolver().resolve(node)
+    return node
+
+
+class Resolver:
+    """
+    Percorre a árvore sintática mantendo uma pilha de escopos locais.
+
+    Cada escopo é um dicionário que mapeia os nomes declarados para o índice
+    correspondente na lista de valores do escopo.
+    """
+
+    def __init__(self):
+        self.scopes: list[dict[str, int]] = []
+
+    def begin_scope(self, names: Iterable[str] = ()) -> dict[str, int]:
+        scope = {name: i for i, name in enumerate(names)}
+        self.scopes.append(scope)
+        return scope
+
+    def end_scope(self) -> int:
+        """
+        Remove o escopo mais interno e retorna o número de slots usados.
+        """
+        return len(self.scopes.pop())
+
+    def declare(self, name: str) -> int | None:
+        """
+        Declara nome no escopo mais interno e retorna seu slot.
+
+        Retorna None se o nome for global.
+        """
+        if not self.scopes:
+            return None
+        scope = self.scopes[-1]
+        return scope.setdefault(name, len(scope))
+
+    def lookup(self, name: str) -> tuple[int | None, int | None]:
+        """
+        Retorna a dupla (env_depth, slot) de um nome.
+
+        Retorna (None, None) se o nome não foi declarado em nenhum escopo local.
+        """
+        for depth, scope in enumerate(reversed(self.scopes)):
+            if name in scope:
+                return depth, scope[name]
+        return None, None
+
+    @singledispatchmethod
+    def resolve(self, node: Node):
+        for child in node.children():
+            self.resolve(child)
+
+    @resolve.register
+    def _(self, node: Var):
+        node.env_depth, node.slot = self.lookup(node.name)
+
+    @resolve.register
+    def _(self, node: Assign):
+        self.resolve(node.value)
+        node.env_depth, node.slot = self.lookup(node.name)
+
+    @resolve.register
+    def _(self, node: This):
+        node.env_depth, node.slot = self.lookup("this")
+
+    @resolve.register
+    def _(self, node: Super):
+        node.env_depth, node.slot = self.lookup("super")
+        node.this_depth, node.this_slot = self.lookup("this")
+
+    @resolve.register
+    def _(self, node: VarDef):
+        # O valor inicial é resolvido antes da declaração para que referências
+        # ao mesmo nome apontem para o escopo externo.
+        self.resolve(node.value)
+        node.slot = self.declare(node.name)
+
+    @resolve.register
+    def _(self, node: Block):
+        if not any(isinstance(stmt, DECLARATIONS) for stmt in node.stmts):
+            node.n_locals = 0
+            for stmt in node.stmts:
+                self.resolve(stmt)
+            return
+
+        self.begin_scope()
+        for stmt in node.stmts:
+            self.resolve(stmt)
+        node.n_locals = self.end_scope()
+
+    @resolve.register
+    def _(self, node: Function):
+        # A função é declarada antes do corpo para permitir recursão.
+        node.slot = self.declare(node.name)
+        self.resolve_function(node)
+
+    @resolve.register
+    def _(self, node: Class):
+        node.slot = self.declare(node.name)
+
+        if node.superclass is not None:
+            node.super_depth, node.super_slot = self.lookup(node.superclass)
+            self.begin_scope(["super"])
+
+        for method in node.methods:
+            self.begin_scope(["this"])
+            self.resolve_function(method)
+            self.end_scope()
+
+        if node.superclass is not None:
+            self.end_scope()
+
+    def resolve_function(self, node: Function):
+        # Os parâmetros e as variáveis declaradas diretamente no corpo
+        # compartilham o mesmo escopo, criado uma única vez a cada chamada.
+        self.begin_scope(node.params)
+        for stmt in node.body.stmts:
+            self.resolve(stmt)
+        node.body.n_locals = 0
+        node.frame_size = self.end_scope()
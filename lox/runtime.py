@@ -1,7 +1,7 @@
 import builtins
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from operator import neg
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from types import FunctionType, BuiltinFunctionType
 
 from .ctx import Ctx
@@ -46,13 +46,29 @@ class LoxClass:
         Se não encontrar, procura nas bases.
         Se não existir em nenhum dos dois lugares, levanta uma exceção LoxError.
         """
-        if name in self.methods:
-            return self.methods[name]
-        
-        if self.base is not None:
-            return self.base.get_method(name)
-        
-        raise LoxError(f"Undefined method '{name}'.")
+        try:
+            return self.all_methods()[name]
+        except KeyError:
+            raise LoxError(f"Undefined method '{name}'.")
+
+    def all_methods(self) -> dict[str, "LoxFunction"]:
+        """
+        Dicionário com os métodos da classe e de todas as suas bases.
+
+        O dicionário é criado na primeira chamada e reaproveitado nas seguintes.
+        Classes Lox não podem ser modificadas depois de criadas, portanto não é
+        necessário invalidar o resultado.
+        """
+        try:
+            return self._all_methods
+        except AttributeError:
+            pass
+        if self.base is None:
+            methods = dict(self.methods)
+        else:
+            methods = {**self.base.all_methods(), **self.methods}
+        self._all_methods = methods
+        return methods
     
     def __str__(self):
         return self.name
@@ -74,15 +90,44 @@ class LoxInstance:
         """
         Busca métodos na classe quando o atributo não existe na instância.
         """
-        method = self.__class.get_method(attr)
-        if method:
-            if attr == "init":
-                return self._create_init_wrapper(method)
-            else:
-                return LoxBoundMethod(self, method)
+        return self.get_attr(attr)
+
+    def get_attr(self, attr: str, cache: "MethodCache | None" = None) -> "Value":
+        """
+        Obtém um campo da instância ou, caso não exista, o método vinculado a
+        ela.
+
+        O cache opcional guarda o último método encontrado por um ponto do
+        código que acessa atributos (veja lox.ast.Getattr), evitando a busca
+        pelo método na classe quando a classe da instância se repete.
+        """
+        values = self.__dict__
+        if attr in values:
+            return values[attr]
+
+        lox_class = self.__class
+        if cache is None:
+            method = lox_class.get_method(attr)
         else:
-            raise AttributeError(f"'{self.__class.name}' object has no attribute '{attr}'")
+            method = cache.lookup(lox_class, attr)
+
+        if attr == "init":
+            return self._create_init_wrapper(method)
+        return self._bind_method(attr, method)
     
+    def _bind_method(self, attr: str, method: "LoxFunction") -> "LoxBoundMethod":
+        """
+        Vincula o método a esta instância.
+
+        Cada acesso cria um novo LoxBoundMethod, já que métodos vinculados são
+        comparados por identidade. Apenas o escopo do this é criado a cada
+        acesso: a função que executa a chamada pertence ao método e é
+        compartilhada por todas as instâncias. A instância não guarda
+        referências aos seus métodos vinculados e, portanto, não forma ciclos
+        com eles.
+        """
+        return LoxBoundMethod(self, method)
+
     def _create_init_wrapper(self, init_method):
         """
         Cria um wrapper para o método init que sempre retorna this.
@@ -94,6 +139,31 @@ class LoxInstance:
         return init_wrapper
 
 
+class MethodCache:
+    """
+    Cache do último método encontrado em um ponto do código.
+
+    Como classes Lox não mudam depois de criadas, basta comparar a classe da
+    instância com a classe do último acesso.
+    """
+
+    __slots__ = ("lox_class", "method")
+
+    def __init__(self):
+        self.lox_class: LoxClass | None = None
+        self.method: "LoxFunction | None" = None
+
+    def lookup(self, lox_class: LoxClass, attr: str) -> "LoxFunction":
+        """
+        Obtém o método attr de lox_class, consultando a classe apenas quando
+        ela é diferente da anterior.
+        """
+        if lox_class is not self.lox_class:
+            self.method = lox_class.get_method(attr)
+            self.lox_class = lox_class
+        return self.method  # type: ignore[return-value]
+
+
 class LoxBoundMethod:
     """
     Método vinculado a uma instância.
@@ -101,25 +171,22 @@ class LoxBoundMethod:
     def __init__(self, instance: "LoxInstance", method: "LoxFunction"):
         self.instance = instance
         self.method = method
-        from .ctx import Ctx
-        self.bound_ctx = Ctx({"this": instance})
+
+        # Mesmo layout de escopos usado pelo resolvedor: this e depois os
+        # parâmetros. O escopo do this é o mesmo para todas as chamadas e
+        # define o this tanto pelo nome quanto pelo slot 0.
+        #
+        # Os atributos ctx, params e _call têm o mesmo significado que em
+        # LoxFunction, o que permite que Call.eval execute ambos pelo mesmo
+        # caminho rápido.
+        self.ctx = Ctx({"this": instance}, method.ctx, [instance])
+        self.params = method.params
+        self._call = method._call
     
     def __call__(self, *args):
-        if len(args) != len(self.method.params):
-            raise LoxError(f"Expected {len(self.method.params)} arguments but got {len(args)}.")
-        
-        from .ctx import Ctx
-        env = {"this": self.instance}
-        for i, param in enumerate(self.method.params):
-            if i < len(args):
-                env[param] = args[i]
-        
-        new_ctx = self.method.ctx.push(env)
-        try:
-            self.method.body.eval(new_ctx)
-            return None
-        except LoxReturn as e:
-            return e.value
+        if len(args) != len(self.params):
+            raise LoxError(f"Expected {len(self.params)} arguments but got {len(args)}.")
+        return self._call(self.ctx, *args)
     
     def __str__(self):
         return f"<fn {self.method.name}>"
@@ -131,14 +198,22 @@ class LoxBoundMethod:
         return id(self)
 
 
-class LoxReturn(Exception):
+class ReturnSignal:
     """
-    Exceção para retornar de uma função Lox.
+    Sinaliza a execução de um comando return.
+
+    Em vez de lançar uma exceção, Return.eval guarda o valor retornado em
+    RETURN_SIGNAL.value e retorna o próprio RETURN_SIGNAL. Blocos, condicionais
+    e laços repassam o sinal até a função em execução, que lê o valor.
     """
 
-    def __init__(self, value):
-        self.value = value
-        super().__init__()
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: "Value" = None
+
+
+RETURN_SIGNAL = ReturnSignal()
 
 
 class SuperProxy:
@@ -272,6 +347,11 @@ def truediv(left: "Value", right: "Value") -> "Value":
     """
     Divide dois números.
     """
+    # BinOp.eval não possui caminho rápido para a divisão, que sempre chega
+    # aqui. Verificamos primeiro o caso mais comum, entre dois floats.
+    if type(left) is float and type(right) is float:
+        return left / right if right != 0 else float('nan')
+
     if isinstance(left, bool) or isinstance(right, bool):
         raise LoxError("Operands must be numbers.")
     
@@ -337,7 +417,7 @@ def eq(left: "Value", right: "Value") -> bool:
     """
     Verifica igualdade estrita (sem conversão de tipos).
     """
-    if type(left) != type(right):
+    if type(left) is not type(right):
         return False
     
     return left == right
@@ -357,42 +437,120 @@ def not_(value: "Value") -> bool:
     return not truthy(value)
 
 
-@dataclass
-@dataclass
+@dataclass(eq=False, repr=False, slots=True)
 class LoxFunction:
     """
     Classe base para todas as funções Lox.
+
+    Funções são comparadas por identidade, como em Lox.
     """
 
     name: str
     params: list[str]
     body: "Block"
     ctx: Ctx
+    # Número de posições do escopo local de cada chamada (parâmetros e
+    # variáveis do corpo), calculado pelo resolvedor. None para funções
+    # não resolvidas.
+    frame_size: int | None = None
+    # Função que executa o corpo, recebendo o contexto onde a chamada é
+    # empilhada (veja specialize_call). Não depende do contexto da função e,
+    # portanto, pode ser compartilhada entre todas as funções criadas a partir
+    # da mesma declaração.
+    _call: Callable | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self._call is None:
+            self._call = specialize_call(self.body, self.params, self.frame_size)
 
     def __call__(self, *args):
         if len(args) != len(self.params):
             raise LoxError(f"Expected {len(self.params)} arguments but got {len(args)}.")
-        
-        env = dict(zip(self.params, args, strict=True))
-        new_ctx = self.ctx.push(env)
-
-        try:
-            self.body.eval(new_ctx)
-            return None
-        except LoxReturn as e:
-            return e.value
+        return self._call(self.ctx, *args)
     
     def bind(self, obj: "Value") -> "LoxFunction":
         """
         Associa essa função a um this específico, criando uma nova função
         com um contexto que inclui {"this": obj}.
         """
+        if self.frame_size is None:
+            ctx = self.ctx.push({"this": obj})
+        else:
+            ctx = self.ctx.push_frame([obj])
         return LoxFunction(
             name=self.name,
             params=self.params,
             body=self.body,
-            ctx=self.ctx.push({"this": obj})
+            ctx=ctx,
+            frame_size=self.frame_size,
+            _call=self._call,
         )
 
     def __str__(self):
-        return f"<fn {self.name}>"
\ No newline at end of file
+        return f"<fn {self.name}>"
+
+
+# Tipos de funções Lox que podem ser executados diretamente pela função
+# _call, recebendo o contexto ctx e os argumentos, depois de verificada a
+# aridade em params.
+LOX_CALLABLES = (LoxFunction, LoxBoundMethod)
+
+
+def specialize_call(body: "Block", params: list[str], frame_size: int | None):
+    """
+    Cria a função que executa body com os argumentos recebidos.
+
+    A função resultante recebe como primeiro argumento o contexto sobre o qual
+    o escopo da chamada é empilhado: o contexto da função ou, para métodos
+    vinculados, o escopo do this.
+
+    Cada chamada cria um único escopo local com frame_size posições: os
+    parâmetros ocupam as primeiras e as variáveis declaradas diretamente no
+    corpo da função ocupam as demais. Funções com até 3 parâmetros recebem uma
+    versão especializada que monta este escopo diretamente, sem criar tuplas
+    intermediárias. A aridade deve ser verificada por quem chama.
+    """
+    if frame_size is None:
+        # Corpo não resolvido: parâmetros em um escopo baseado em dicionário.
+        def call(ctx, *args):
+            if body.eval(ctx.push(dict(zip(params, args)))) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+        return call
+
+    n_params = len(params)
+    pad = (None,) * (frame_size - n_params)
+
+    if n_params == 0:
+        def call(ctx):
+            if body.eval(ctx.push_frame([*pad])) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+
+    elif n_params == 1:
+        def call(ctx, a):
+            if body.eval(ctx.push_frame([a, *pad])) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+
+    elif n_params == 2:
+        def call(ctx, a, b):
+            if body.eval(ctx.push_frame([a, b, *pad])) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+
+    elif n_params == 3:
+        def call(ctx, a, b, c):
+            if body.eval(ctx.push_frame([a, b, c, *pad])) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+
+    else:
+        def call(ctx, *args):
+            frame = [None] * frame_size
+            frame[:n_params] = args
+            if body.eval(ctx.push_frame(frame)) is RETURN_SIGNAL:
+                return RETURN_SIGNAL.value
+            return None
+
+    return call
@@ -7,11 +7,14 @@ A resolução de vários exercícios requer a modificação ou implementação d
 métodos desta classe.
 """
 
+import operator
+import sys
 from typing import Callable
 from lark import Transformer, v_args
 
 from . import runtime as op
 from .ast import *
+from .node import Node
 
 
 def op_handler(op: Callable):
@@ -21,14 +24,170 @@ def op_handler(op: Callable):
     Recebe a função que implementa a operação em tempo de execução.
     """
 
+    op_tag = OP_TAGS.get(op, OP_GENERIC)
+    num_op = NUMERIC_OPS.get(op)
+
     def method(self, left, right):
-        return BinOp(left, right, op)
+        node = _fold(BinOp(left, right, op))
+        if not isinstance(node, BinOp):
+            return node
+        if num_op is not None and _is_number(left) and _is_number(right):
+            node = BinOpNum(left, right, num_op)
+        node.op_tag = op_tag
+        return node
 
     return method
 
 
+# Códigos das operações com caminho rápido em BinOp.eval.
+OP_TAGS: dict[Callable, int] = {
+    op.add: OP_ADD,
+    op.sub: OP_SUB,
+    op.mul: OP_MUL,
+    op.lt: OP_LT,
+    op.gt: OP_GT,
+    op.le: OP_LE,
+    op.ge: OP_GE,
+    op.eq: OP_EQ,
+    op.ne: OP_NE,
+}
+
+# Versões sem verificação de tipos das operações do runtime, usadas quando
+# ambos os operandos certamente são números. A divisão e as comparações de
+# igualdade não estão aqui, pois o runtime trata a divisão por zero e a
+# comparação entre tipos diferentes de forma especial.
+NUMERIC_OPS: dict[Callable, Callable] = {
+    op.add: operator.add,
+    op.sub: operator.sub,
+    op.mul: operator.mul,
+    op.lt: operator.lt,
+    op.gt: operator.gt,
+    op.le: operator.le,
+    op.ge: operator.ge,
+}
+
+# Operações cujo resultado, quando não falham, é sempre um número.
+_NUMBER_RESULT = {op.sub, op.mul, op.truediv, operator.add, operator.sub, operator.mul}
+
+
+def _is_number(node: Node) -> bool:
+    """
+    Inferência de tipos mínima: verifica se a expressão certamente produz um
+    número, caso não falhe.
+
+    A soma só produz números quando os dois lados são números. Neste caso, ela
+    já foi convertida para BinOpNum com operator.add.
+    """
+    if isinstance(node, Literal):
+        return type(node.value) is float
+    if isinstance(node, BinOp):
+        return node.op in _NUMBER_RESULT
+    if isinstance(node, UnaryOp):
+        return node.op is op.neg and _is_number(node.expr)
+    return False
+
+
+def _fold(node: Node) -> Node:
+    """
+    Avalia as partes constantes de uma expressão ou comando durante a
+    construção da árvore sintática.
+
+    Operações binárias cujos operandos são constantes são substituídas pelo
+    resultado. Operações que falham não são avaliadas, para que o erro aconteça
+    em tempo de execução. And, Or e If com condições constantes são
+    substituídos pelo ramo que seria executado, desde que o ramo descartado
+    não precise passar pela análise semântica.
+
+    Operações unárias isoladas, como -42, são mantidas na árvore e só são
+    avaliadas como parte de uma expressão maior.
+    """
+    if isinstance(node, BinOp):
+        left = _constant(node.left)
+        right = _constant(node.right)
+        if left is not _NOT_CONSTANT and right is not _NOT_CONSTANT:
+            try:
+                return Literal(node.op(left, right))
+            except (op.LoxError, TypeError):
+                pass
+
+    elif isinstance(node, (And, Or)):
+        left = _constant(node.left)
+        if left is not _NOT_CONSTANT:
+            # And retorna o lado esquerdo se ele for falso e Or se ele for
+            # verdadeiro. Caso contrário, ambos retornam o lado direito.
+            if op.truthy(left) == isinstance(node, Or):
+                if _is_unchecked(node.right):
+                    return Literal(left)
+            else:
+                return node.right
+
+    elif isinstance(node, If):
+        condition = _constant(node.condition)
+        if condition is not _NOT_CONSTANT:
+            if op.truthy(condition):
+                taken, dropped = node.then_stmt, node.else_stmt
+            else:
+                taken, dropped = node.else_stmt, node.then_stmt
+            if dropped is None or _is_unchecked(dropped):
+                return Block([]) if taken is None else taken
+
+    return node
+
+
+_NOT_CONSTANT = object()
+
+
+def _constant(node: Node) -> "Value":
+    """
+    Valor de uma expressão constante ou _NOT_CONSTANT, caso a expressão não
+    seja constante ou falhe ao ser avaliada.
+    """
+    if isinstance(node, Literal):
+        return node.value
+    if isinstance(node, UnaryOp):
+        value = _constant(node.expr)
+        if value is not _NOT_CONSTANT:
+            try:
+                return node.op(value)
+            except (op.LoxError, TypeError):
+                pass
+    return _NOT_CONSTANT
+
+
+def _is_unchecked(node: Node) -> bool:
+    """
+    Verifica se nenhum nó da subárvore implementa validate_self.
+    """
+    if type(node).validate_self is not Node.validate_self:
+        return False
+    return all(_is_unchecked(child) for child in node.children())
+
+
 @v_args(inline=True)
 class LoxTransformer(Transformer):
+    # Número máximo de literais compartilhados guardados pelo transformer.
+    LITERAL_CACHE_SIZE = 4096
+
+    def __init__(self, visit_tokens: bool = True):
+        super().__init__(visit_tokens)
+        self._lit_cache: dict[tuple[type, Value], Literal] = {}
+
+    def _literal(self, value: Value) -> Literal:
+        """
+        Retorna um nó Literal para o valor, reaproveitando o mesmo nó para
+        constantes repetidas no código.
+
+        Isto é seguro, pois literais nunca são modificados depois de criados.
+        O tipo faz parte da chave para que 1.0 e true não sejam confundidos.
+        """
+        key = (type(value), value)
+        node = self._lit_cache.get(key)
+        if node is None:
+            node = Literal(value)
+            if len(self._lit_cache) < self.LITERAL_CACHE_SIZE:
+                self._lit_cache[key] = node
+        return node
+
     def program(self, *stmts):
         return Program(list(stmts))
 
@@ -66,19 +225,21 @@ class LoxTransformer(Transformer):
         return Print(expr)
 
     def VAR(self, token):
-        name = str(token)
+        # Nomes internados tornam mais rápidas as buscas em dicionários de
+        # escopos, métodos e atributos das instâncias.
+        name = sys.intern(str(token))
         return Var(name)
 
     def NUMBER(self, token):
         num = float(token)
-        return Literal(num)
+        return self._literal(num)
     
     def STRING(self, token):
         text = str(token)[1:-1]
-        return Literal(text)
+        return self._literal(text)
     
     def NIL(self, _):
-        return Literal(None)
+        return self._literal(None)
 
     def super(self, _):
         from .ast import Super
@@ -93,7 +254,7 @@ class LoxTransformer(Transformer):
         return This()
 
     def BOOL(self, token):
-        return Literal(token == "true")
+        return self._literal(token == "true")
 
     def primary(self, child):
         return child
@@ -105,10 +266,10 @@ class LoxTransformer(Transformer):
         return UnaryOp(expr, op.not_)
     
     def and_(self, left, right):
-        return And(left, right)
+        return _fold(And(left, right))
     
     def or_(self, left, right):
-        return Or(left, right)
+        return _fold(Or(left, right))
     
     def assign(self, name, value):
         return Assign(name.name, value)
@@ -123,13 +284,13 @@ class LoxTransformer(Transformer):
         return VarDef(name.name, value)
     
     def var_def_no_init(self, name):
-        return VarDef(name.name, Literal(None))
+        return VarDef(name.name, self._literal(None))
     
     def block(self, *stmts):
         return Block(list(stmts))
     
     def if_stmt(self, condition, then_stmt, else_stmt=None):
-        return If(condition, then_stmt, else_stmt)
+        return _fold(If(condition, then_stmt, else_stmt))
     
     def while_stmt(self, condition, body):
         return While(condition, body)
@@ -0,0 +1,93 @@
+"""
+Análise semântica da árvore sintática.
+
+O validador percorre a árvore uma única vez, de cima para baixo, chamando o
+método `validate_self` de cada nó. Durante o percurso, mantém pilhas com as
+classes, funções e declarações de variáveis que envolvem o nó atual. Deste
+modo, as verificações que dependem do contexto (ex.: `this` fora de uma
+classe) são feitas em tempo constante, sem percorrer os pais de cada nó.
+"""
+
+from dataclasses import dataclass, field
+
+from .ast import Block, Class, Function, VarDef
+from .node import Node
+
+
+def validate(node: Node) -> Node:
+    """
+    Valida o nó e todos os seus descendentes.
+
+    Lança um SemanticError no primeiro erro encontrado.
+    """
+    AstValidator().visit(node)
+    return node
+
+
+@dataclass
+class FunctionScope:
+    """
+    Função que envolve o nó sendo validado.
+    """
+
+    function: Function
+    is_method: bool
+
+    @property
+    def is_initializer(self) -> bool:
+        return self.is_method and self.function.name == "init"
+
+
+@dataclass
+class Initializer:
+    """
+    Declaração de variável cujo valor inicial está sendo validado.
+    """
+
+    vardef: VarDef
+    is_local: bool
+
+
+@dataclass
+class AstValidator:
+    """
+    Estado da análise semântica.
+
+    Cada pilha contém os nós que envolvem o nó sendo validado, do mais externo
+    para o mais interno.
+    """
+
+    class_stack: list[Class] = field(default_factory=list)
+    function_stack: list[FunctionScope] = field(default_factory=list)
+    initializer_stack: list[Initializer] = field(default_factory=list)
+    block_depth: int = 0
+
+    def visit(self, node: Node, parent: Node | None = None):
+        node.validate_self(self)
+
+        if isinstance(node, Class):
+            self.class_stack.append(node)
+            self.visit_children(node)
+            self.class_stack.pop()
+
+        elif isinstance(node, Function):
+            self.function_stack.append(FunctionScope(node, isinstance(parent, Class)))
+            self.visit_children(node)
+            self.function_stack.pop()
+
+        elif isinstance(node, VarDef):
+            self.initializer_stack.append(Initializer(node, self.block_depth > 0))
+            self.visit_children(node)
+            self.initializer_stack.pop()
+
+        elif isinstance(node, Block):
+            self.block_depth += 1
+            self.visit_children(node)
+            self.block_depth -= 1
+
+        else:
+            self.visit_children(node)
+
+    def visit_children(self, node: Node):
+        for child in node.children():
+            self.visit(child, node)
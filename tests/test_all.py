@@ -20,15 +20,6 @@ def examples():
         "function": {
             "too_many_arguments",
             "too_many_parameters",
-            "local_mutual_recursion",
-        },
-        # Py-lox não realiza o early binding
-        "closure": {
-            "close_over_method_parameter",
-            "assign_to_shadowed_later",
-        },
-        "variable": {
-            "early_bound",
         },
     }
 
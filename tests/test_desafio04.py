@@ -8,6 +8,3 @@ from lox.ast import *
 @pytest.mark.full_suite
 class TestExamplesVariable(testing.ExampleTester):
     module = "variable"
-    exclude = {
-        "early_bound",
-    }
@@ -0,0 +1,102 @@
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from lox import *
+from lox import runtime as op
+from lox.ast import *
+from lox.errors import SemanticError
+from lox.runtime import LoxError
+
+
+def test_operações_com_literais_são_avaliadas_na_construção_da_árvore():
+    assert parse_expr("1 + 2 * 3") == Literal(7.0)
+    assert parse_expr('"a" + "b"') == Literal("ab")
+    assert parse_expr("-1 + 2") == Literal(1.0)
+
+
+def test_operações_unárias_isoladas_são_mantidas():
+    assert isinstance(parse_expr("-42"), UnaryOp)
+    assert isinstance(parse_expr("!true"), UnaryOp)
+
+
+def test_operações_inválidas_falham_em_tempo_de_execução():
+    expr = parse_expr('1 + "a"')
+    assert isinstance(expr, BinOp)
+    with pytest.raises(LoxError):
+        expr.eval(Ctx())
+
+
+def test_and_or_com_lado_esquerdo_constante():
+    assert parse_expr("true and x") == Var("x")
+    assert parse_expr("false or x") == Var("x")
+    assert parse_expr('nil and "a"') == Literal(None)
+    assert parse_expr('1 or "a"') == Literal(1.0)
+
+
+def test_if_com_condição_constante():
+    assert parse("if (true) print 1; else print 2;").stmts == [Print(Literal(1.0))]
+    assert parse("if (false) print 1;").stmts == [Block([])]
+
+
+def test_ramo_descartado_continua_sendo_validado():
+    with pytest.raises(SemanticError):
+        parse("if (false) return 1;")
+
+
+def test_operações_entre_números_dispensam_verificação_de_tipos():
+    expr = parse_expr("(x - 1) * (y - 2) < -z")
+    assert isinstance(expr.left, BinOpNum)
+    assert not isinstance(expr, BinOpNum)
+    assert expr.eval(Ctx.from_dict({"x": 3.0, "y": 4.0, "z": -5.0})) is True
+    assert not isinstance(parse_expr("x + y"), BinOpNum)
+    assert not isinstance(parse_expr('(x - 1) + "a"'), BinOpNum)
+
+
+def test_literais_repetidos_compartilham_o_mesmo_nó():
+    tree = parse('print 1; print 1; print true; print "a"; print "a";')
+    one, other_one, true, a, other_a = (stmt.expr for stmt in tree.stmts)
+    assert one is other_one
+    assert a is other_a
+    assert true is not one
+
+
+def test_operações_entre_números_com_variáveis_locais():
+    src = """
+    fun f(x) { return (x - 1) * (x - 2); }
+    var x = "global";
+    { var y = 3; print (y - 1) * (y - 2); }
+    print f(5);
+    """
+    with redirect_stdout(io.StringIO()) as fd:
+        parse(src).eval(Ctx())
+    assert fd.getvalue() == "2\n12\n"
+
+
+def test_operandos_de_operações_entre_números_são_visitados():
+    expr = parse_expr("(x - 1) * (y - 2)")
+    assert isinstance(expr, BinOpNum)
+    assert len(list(expr.children())) == 2
+    with pytest.raises(SemanticError):
+        parse("print (this - 1) * 2;")
+
+
+def test_operações_binárias_recebem_o_código_da_operação():
+    assert parse_expr("x + 1").op_tag == OP_ADD
+    assert parse_expr("x < 1").op_tag == OP_LT
+    assert BinOp(Var("x"), Literal(1.0), op.add).op_tag == OP_GENERIC
+
+
+@pytest.mark.parametrize("src, env, value", [
+    ("x + y", {"x": 1.0, "y": 2.0}, 3.0),
+    ("x + y", {"x": "a", "y": "b"}, "ab"),
+    ("x == y", {"x": 1.0, "y": "1"}, False),
+    ("x / y", {"x": 1.0, "y": 0.0}, None),
+])
+def test_caminho_rápido_preserva_a_semântica(src, env, value):
+    result = parse_expr(src).eval(Ctx.from_dict(env))
+    if value is None:
+        assert result != result
+    else:
+        assert result == value
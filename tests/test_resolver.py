@@ -0,0 +1,94 @@
+import io
+from contextlib import redirect_stdout
+
+from lox import *
+from lox.ast import *
+
+
+def run(src: str) -> str:
+    with redirect_stdout(io.StringIO()) as fd:
+        parse(src).eval(Ctx())
+    return fd.getvalue()
+
+
+def find(node: Node, cls: type) -> list:
+    found = []
+
+    def visit(node):
+        if isinstance(node, cls):
+            found.append(node)
+        for child in node.children():
+            visit(child)
+
+    visit(node)
+    return found
+
+
+def test_variáveis_globais_não_são_resolvidas():
+    tree = parse("var x = 1; print x;")
+    [var] = find(tree, Var)
+    assert var.env_depth is None
+    assert find(tree, VarDef)[0].slot is None
+
+
+def test_variáveis_locais_recebem_profundidade_e_slot():
+    tree = parse("fun f(a, b) { var c = a; { print b + c; } }")
+    names = {var.name: (var.env_depth, var.slot) for var in find(tree, Var)}
+    assert names == {"a": (0, 0), "b": (0, 1), "c": (0, 2)}
+
+
+def test_bloco_sem_declarações_não_usa_slots():
+    tree = parse("if (true) { print a; }")
+    [block] = find(tree, Block)
+    assert block.n_locals == 0
+
+
+def test_corpo_da_função_compartilha_o_escopo_dos_parâmetros():
+    tree = parse("fun f(a) { var b = a; { var c = b; } }")
+    [function] = find(tree, Function)
+    assert function.frame_size == 2
+    assert function.body.n_locals == 0
+
+
+def test_closure_captura_o_escopo_da_declaração():
+    src = """
+    var a = "global";
+    {
+        fun show() { print a; }
+        show();
+        var a = "local";
+        show();
+    }
+    """
+    assert run(src) == "global\nglobal\n"
+
+
+def test_this_e_super_são_resolvidos_em_métodos():
+    src = """
+    class A { m() { return "A"; } }
+    class B < A { m() { return "B" + super.m(); } }
+    print B().m();
+    """
+    tree = parse(src)
+    [super_node] = find(tree, Super)
+    assert (super_node.env_depth, super_node.slot) == (2, 0)
+    assert (super_node.this_depth, super_node.this_slot) == (1, 0)
+    assert run(src) == "BA\n"
+
+
+def test_anotações_do_resolvedor_não_aparecem_na_árvore():
+    tree = parse("fun f(a) { return a; }")
+    [var] = find(tree, Var)
+    assert var.slot == 0
+    assert "slot" not in tree.pretty()
+    assert var == Var("a")
+    assert not hasattr(var, "__dict__")
+
+
+def test_frames_com_slots_não_alocam_escopo_por_nome():
+    ctx = Ctx()
+    first = ctx.push_frame([1.0])
+    second = first.push_frame([2.0, 3.0])
+    assert first.scope is second.scope
+    assert second.get_slot(1, 0) == 1.0
+    assert not hasattr(second, "__dict__")
@@ -0,0 +1,70 @@
+import gc
+import io
+import weakref
+from contextlib import redirect_stdout
+
+import pytest
+
+from lox import *
+from lox.runtime import LoxError
+
+
+def run(src: str) -> dict:
+    env: dict = {}
+    with redirect_stdout(io.StringIO()):
+        eval(src, env)
+    return env
+
+
+SRC = """
+class A { init(x) { this.x = x; } m(d) { return this.x + d; } }
+var a = A(1);
+var m1 = a.m;
+var m2 = a.m;
+var b = A(10);
+"""
+
+
+def test_métodos_vinculados_são_comparados_por_identidade():
+    env = run(SRC)
+    assert env["m1"] is not env["m2"]
+    assert env["m1"] != env["m2"]
+    assert env["m1"](2) == 3.0
+
+
+def test_instâncias_compartilham_a_função_de_chamada_do_método():
+    env = run(SRC)
+    a, b = env["a"], env["b"]
+    assert a.m.method._call is b.m.method._call
+    assert a.m.ctx["this"] is a
+    assert b.m(2) == 12.0
+
+
+def test_métodos_vinculados_não_criam_ciclos_com_a_instância():
+    env = run(SRC)
+    a = env.pop("a")
+    a.m(1)
+    ref = weakref.ref(a)
+    gc.disable()
+    try:
+        env.clear()
+        del a
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_cache_de_métodos_acompanha_a_classe_da_instância():
+    src = """
+    class A { m() { return "A"; } }
+    class B < A { m() { return "B"; } }
+    fun f(o) { return o.m(); }
+    var r = f(A()) + f(B()) + f(A());
+    """
+    assert run(src)["r"] == "ABA"
+
+
+def test_chamadas_com_aridade_errada_falham():
+    for src in ["fun f(a) {} f(1, 2);", "class A { m() {} } A().m(1);"]:
+        with pytest.raises(LoxError, match="Expected"):
+            run(src)
@@ -0,0 +1,42 @@
+import pytest
+
+from lox import *
+from lox.errors import SemanticError
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "print this;",
+        "fun f() { return super.m; }",
+        "class A { m() { return super.m(); } }",
+        "return 1;",
+        "class A { init() { return 1; } }",
+        "{ var a = a; }",
+        "fun f(a) { var a = 1; }",
+    ],
+)
+def test_erros_semânticos(src):
+    with pytest.raises(SemanticError):
+        parse(src)
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "class A { m() { fun f() { return this; } return f; } }",
+        "class A {} class B < A { m() { return super.m(); } }",
+        "fun init() { return 1; }",
+        "class A { init() { return; } }",
+        "var a = 1; var b = a;",
+        "var a = 1; { var b = a; }",
+    ],
+)
+def test_programas_válidos(src):
+    parse(src)
+
+
+def test_validação_de_programas_muito_aninhados():
+    depth = 200
+    src = "fun f() {" + "{ var x = 1;" * depth + "return x;" + "}" * depth + "}"
+    parse(src)